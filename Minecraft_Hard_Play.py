@@ -28,6 +28,7 @@ class Man(games.Sprite):
 class Nakovalny(games.Sprite):
     image = games.load_image("Nak (2).png")
     speed = 1.5
+    game_over = False
 
     def __init__(self, x,y = 100):
         super(Nakovalny, self).__init__(image=Nakovalny.image, x = x, y = y, dy=Nakovalny.speed)
@@ -41,6 +42,9 @@ class Nakovalny(games.Sprite):
         self.destroy()
 
     def end_game(self):
+        if Nakovalny.game_over:
+            return
+        Nakovalny.game_over = True
         end_message = games.Message(value="Game Over!", size = 90, color=color.red,
                                         x=games.screen.width / 2, y=games.screen.height / 2, lifetime=2*games.screen.fps,
                                         after_death = games.screen.quit)
@@ -48,6 +52,7 @@ class Nakovalny(games.Sprite):
 
 class Sky(games.Sprite):
     time_til_drop = 0
+    drop_gap = 1.2
     image_sky = games.load_image("Sky.png")
 
     def __init__(self, y = -10, speed = 2, change = 200):
@@ -67,9 +72,10 @@ class Sky(games.Sprite):
         else:
             new_krip = Nakovalny(x = self.x)
             games.screen.add(new_krip)
-            self.time_til_drop = int(new_krip.height * 1.2 / Nakovalny.speed)
+            self.time_til_drop = int(new_krip.height * Sky.drop_gap / Nakovalny.speed)
 
-def main():
+def main(seed=None):
+    random.seed(seed)
     background_image = games.load_image("back_image.jpg", transparent=False)
     games.screen.background = background_image
 